@@ -586,24 +586,30 @@ async def shield_violation_generator(
         api_params: ResponsesApiParams
         context: ResponsesContext
     Yields:
-        SSE-formatted strings for streaming events, ending with [DONE]
+        A single chunk holding all SSE-formatted events, ending with [DONE].
+        All events are known upfront, so they are written in one go instead
+        of one transport write per event.
     """
     normalized_conv_id = normalize_conversation_id(api_params.conversation)
     available_quotas = get_available_quotas(
         quota_limiters=configuration.quota_limiters, user_id=context.auth[0]
     )
     moderation_result = cast(ShieldModerationBlocked, context.moderation_result)
+    # Fields shared by the created and completed response objects are built once
+    created_at = int(context.started_at.timestamp())
+    echoed_params = api_params.echoed_params(configuration.rag_id_mapping)
+    sse_events: list[str] = []
 
     # 1. Send response.created event with status "in_progress" and empty output
     created_response_object = ResponsesResponse.model_construct(
         id=moderation_result.moderation_id,
-        created_at=int(context.started_at.timestamp()),
+        created_at=created_at,
         status="in_progress",
         output=[],
         conversation=normalized_conv_id,
         available_quotas={},
         output_text="",
-        **api_params.echoed_params(configuration.rag_id_mapping),
+        **echoed_params,
     )
     created_response_dict = created_response_object.model_dump(
         exclude_none=True, by_alias=True
@@ -614,34 +620,41 @@ async def shield_violation_generator(
         "response": created_response_dict,
     }
     data_json = json.dumps(created_event)
-    yield f"event: response.created\ndata: {data_json}\n\n"
+    sse_events.append(f"event: response.created\ndata: {data_json}\n\n")
 
-    # 2. Send response.output_item.added event
-    item_added_event = OutputItemAddedChunk(
-        response_id=moderation_result.moderation_id,
-        item=moderation_result.refusal_response,
-        output_index=0,
-        sequence_number=1,
-    )
-    data_json = json.dumps(
-        item_added_event.model_dump(exclude_none=True, by_alias=True)
+    # The events below are serialized right away, so they are built as plain
+    # dicts rather than validated stream chunk models; the refusal item shared
+    # by both of them is dumped only once
+    refusal_item = moderation_result.refusal_response.model_dump(
+        exclude_none=True, by_alias=True
     )
-    yield f"event: response.output_item.added\ndata: {data_json}\n\n"
+
+    # 2. Send response.output_item.added event
+    item_added_event = {
+        "type": "response.output_item.added",
+        "response_id": moderation_result.moderation_id,
+        "item": refusal_item,
+        "output_index": 0,
+        "sequence_number": 1,
+    }
+    data_json = json.dumps(item_added_event)
+    sse_events.append(f"event: response.output_item.added\ndata: {data_json}\n\n")
 
     # 3. Send response.output_item.done event
-    item_done_event = OutputItemDoneChunk(
-        response_id=moderation_result.moderation_id,
-        item=moderation_result.refusal_response,
-        output_index=0,
-        sequence_number=2,
-    )
-    data_json = json.dumps(item_done_event.model_dump(exclude_none=True, by_alias=True))
-    yield f"event: response.output_item.done\ndata: {data_json}\n\n"
+    item_done_event = {
+        "type": "response.output_item.done",
+        "response_id": moderation_result.moderation_id,
+        "item": refusal_item,
+        "output_index": 0,
+        "sequence_number": 2,
+    }
+    data_json = json.dumps(item_done_event)
+    sse_events.append(f"event: response.output_item.done\ndata: {data_json}\n\n")
 
     # 4. Send response.completed event with status "completed" and output populated
     completed_response_object = ResponsesResponse.model_construct(
         id=moderation_result.moderation_id,
-        created_at=int(context.started_at.timestamp()),
+        created_at=created_at,
         completed_at=int(datetime.now(UTC).timestamp()),
         status="completed",
         output=[moderation_result.refusal_response],
@@ -649,7 +662,7 @@ async def shield_violation_generator(
         conversation=normalized_conv_id,
         available_quotas=available_quotas,
         output_text=moderation_result.message,
-        **api_params.echoed_params(configuration.rag_id_mapping),
+        **echoed_params,
     )
     completed_response_dict = completed_response_object.model_dump(
         exclude_none=True, by_alias=True
@@ -660,9 +673,10 @@ async def shield_violation_generator(
         "response": completed_response_dict,
     }
     data_json = json.dumps(completed_event)
-    yield f"event: response.completed\ndata: {data_json}\n\n"
+    sse_events.append(f"event: response.completed\ndata: {data_json}\n\n")
 
-    yield "data: [DONE]\n\n"
+    sse_events.append("data: [DONE]\n\n")
+    yield "".join(sse_events)
 
 
 def _sanitize_response_dict(
@@ -184,16 +184,22 @@ def prepare_input(
     Returns:
         str: The input text with RAG context and attachments appended (if any)
     """
-    input_text: str = query_request.query
+    # Fast path for the most common case: a bare query
+    if not inline_rag_context and not query_request.attachments:
+        return query_request.query
+
+    # Collect the parts and join once to avoid repeated reallocation of
+    # (possibly large) attachment content
+    parts: list[str] = [query_request.query]
     if inline_rag_context:
-        input_text += f"\n\n{inline_rag_context}"
+        parts.append(f"\n\n{inline_rag_context}")
     if query_request.attachments:
         for attachment in query_request.attachments:
             # Append attachment content with type label
-            input_text += (
+            parts.append(
                 f"\n\n[Attachment: {attachment.attachment_type}]\n{attachment.content}"
             )
-    return input_text
+    return "".join(parts)
 
 
 def store_query_results(  # pylint: disable=too-many-arguments
@@ -1271,18 +1271,21 @@ def parse_arguments_string(arguments_str: str) -> dict[str, Any]:
     Returns:
         Parsed dictionary if successful, otherwise {"args": arguments_str}
     """
-    # Try parsing as-is first (most common case)
-    try:
-        parsed = json.loads(arguments_str)
-        if isinstance(parsed, dict):
-            return parsed
-    except (json.JSONDecodeError, ValueError):
-        pass
-
-    # Try wrapping in {} if string doesn't start with {
-    # This handles cases where the string is just the content without braces
     stripped = arguments_str.strip()
-    if stripped and not stripped.startswith("{"):
+
+    # Try parsing as-is first (most common case); only a JSON object can
+    # produce a dict, so skip the parse attempt for anything else
+    if stripped.startswith("{"):
+        try:
+            parsed = json.loads(arguments_str)
+            if isinstance(parsed, dict):
+                return parsed
+        except (json.JSONDecodeError, ValueError):
+            pass
+    elif ":" in stripped:
+        # Try wrapping in {} if string doesn't start with {
+        # This handles cases where the string is just the content without braces;
+        # a wrapped object needs at least one key:value pair, hence the colon check
         try:
             wrapped = "{" + stripped + "}"
             parsed = json.loads(wrapped)
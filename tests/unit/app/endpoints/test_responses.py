@@ -9,7 +9,11 @@ from typing import Any, Optional, cast
 import pytest
 from fastapi import HTTPException, Request
 from fastapi.responses import StreamingResponse
-from llama_stack_api import OpenAIResponseObject
+from llama_stack_api import (
+    OpenAIResponseObject,
+    OpenAIResponseObjectStreamResponseOutputItemAdded,
+    OpenAIResponseObjectStreamResponseOutputItemDone,
+)
 from llama_stack_api.openai_responses import (
     OpenAIResponseInputToolChoiceMode as ToolChoiceMode,
 )
@@ -1208,12 +1212,39 @@ class TestHandleStreamingResponse:
                 else (part if isinstance(part, str) else bytes(part).decode("utf-8"))
             )
             collected.append(chunk_str)
-        body = "".join(collected)
-        assert "event: response.created" in body
-        assert "event: response.output_item.added" in body
-        assert "event: response.output_item.done" in body
-        assert "event: response.completed" in body
-        assert "[DONE]" in body
+        # all shield violation events are written as a single chunk
+        assert len(collected) == 1
+        body = collected[0]
+        event_positions = [
+            body.index("event: response.created"),
+            body.index("event: response.output_item.added"),
+            body.index("event: response.output_item.done"),
+            body.index("event: response.completed"),
+            body.index("data: [DONE]"),
+        ]
+        assert event_positions == sorted(event_positions)
+        # output item events must match the llama-stack stream chunk schema
+        data_lines = [
+            json.loads(line.removeprefix("data: "))
+            for line in body.splitlines()
+            if line.startswith("data: {")
+        ]
+        added = OpenAIResponseObjectStreamResponseOutputItemAdded.model_validate(
+            data_lines[1]
+        )
+        done = OpenAIResponseObjectStreamResponseOutputItemDone.model_validate(
+            data_lines[2]
+        )
+        assert added.item == mock_refusal
+        assert done.item == mock_refusal
+        assert (added.sequence_number, done.sequence_number) == (1, 2)
+        # created and completed events carry independent response snapshots
+        created_response = data_lines[0]["response"]
+        completed_response = data_lines[3]["response"]
+        assert created_response["status"] == "in_progress"
+        assert created_response["output"] == []
+        assert completed_response["status"] == "completed"
+        assert len(completed_response["output"]) == 1
         mock_client.responses.create.assert_not_called()
 
     @pytest.mark.asyncio
@@ -240,6 +240,14 @@ class TestPrepareInput:
         result = prepare_input(query_request)
         assert result == "test query"
 
+    def test_prepare_input_with_empty_attachments_and_rag_context(self) -> None:
+        """Test preparing input with empty attachments and empty RAG context."""
+        query_request = QueryRequest(
+            query="test query", attachments=[]
+        )  # pyright: ignore[reportCallIssue]
+        result = prepare_input(query_request, inline_rag_context="")
+        assert result == "test query"
+
     def test_prepare_input_with_attachments(self) -> None:
         """Test preparing input with attachments."""
         attachment = Attachment(
@@ -255,6 +263,30 @@ class TestPrepareInput:
         assert "[Attachment: text]" in result
         assert "attachment content" in result
 
+    def test_prepare_input_with_rag_context_and_multiple_attachments(self) -> None:
+        """Test that RAG context and attachments are appended in order."""
+        attachments = [
+            Attachment(
+                attachment_type="log",
+                content="first",
+                content_type="text/plain",
+            ),
+            Attachment(
+                attachment_type="configuration",
+                content="second",
+                content_type="application/yaml",
+            ),
+        ]
+        query_request = QueryRequest(
+            query="test query", attachments=attachments
+        )  # pyright: ignore[reportCallIssue]
+        result = prepare_input(query_request, inline_rag_context="rag context")
+        assert result == (
+            "test query\n\nrag context"
+            "\n\n[Attachment: log]\nfirst"
+            "\n\n[Attachment: configuration]\nsecond"
+        )
+
 
 class TestExtractProviderAndModelFromModelId:
     """Tests for extract_provider_and_model_from_model_id function."""
@@ -2674,6 +2674,21 @@ class TestParseArgumentsString:
         result = parse_arguments_string("")
         assert result == {"args": ""}
 
+    def test_parse_arguments_string_json_with_surrounding_whitespace(self) -> None:
+        """Test parsing JSON object surrounded by whitespace."""
+        result = parse_arguments_string('  {"key": "value"}\n')
+        assert result == {"key": "value"}
+
+    def test_parse_arguments_string_scalar_json(self) -> None:
+        """Test parsing JSON scalar without key:value pair falls back."""
+        result = parse_arguments_string("42")
+        assert result == {"args": "42"}
+
+    def test_parse_arguments_string_invalid_object(self) -> None:
+        """Test parsing malformed JSON object falls back to args wrapper."""
+        result = parse_arguments_string('{"key": ')
+        assert result == {"args": '{"key": '}
+
 
 class TestBuildMCPToolCallFromArgumentsDone:
     """Tests for build_mcp_tool_call_from_arguments_done function."""